@@ -1,17 +1,22 @@
 """A library to supplement Discord.py by adding support for slash commands."""
-from .choices import Choice, Choices
-from .client import CommandClient
-from .commands import SlashCommandInvokeError
-from .groups import CommandGroup, CommandSubGroup, subcommand
-from .options import Channel, Mentionable
-from .permissions import (
-    allow_roles,
-    allow_users,
-    disallow_roles,
-    disallow_users,
-    global_permissions,
-    guild_permissions,
-)
+import importlib
+import typing
+from typing import Any
+
+if typing.TYPE_CHECKING:
+    from .choices import Choice, Choices
+    from .client import CommandClient
+    from .commands import SlashCommandInvokeError
+    from .groups import CommandGroup, CommandSubGroup, subcommand
+    from .options import Channel, Mentionable
+    from .permissions import (
+        allow_roles,
+        allow_users,
+        disallow_roles,
+        disallow_users,
+        global_permissions,
+        guild_permissions,
+    )
 
 __version__ = "0.6.4"
 __all__ = (
@@ -32,3 +37,44 @@ __all__ = (
     "global_permissions",
     "SlashCommandInvokeError",
 )
+
+# Public name -> (submodule, attribute). Submodules pull in nextcord, so they
+# are only imported once one of their names is actually used.
+_DYNAMIC_IMPORTS: dict[str, tuple[str, str]] = {
+    "Choice": (".choices", "Choice"),
+    "Choices": (".choices", "Choices"),
+    "CommandClient": (".client", "CommandClient"),
+    "SlashCommandInvokeError": (".commands", "SlashCommandInvokeError"),
+    "CommandGroup": (".groups", "CommandGroup"),
+    "CommandSubGroup": (".groups", "CommandSubGroup"),
+    "subcommand": (".groups", "subcommand"),
+    "Channel": (".options", "Channel"),
+    "Mentionable": (".options", "Mentionable"),
+    "allow_roles": (".permissions", "allow_roles"),
+    "allow_users": (".permissions", "allow_users"),
+    "disallow_roles": (".permissions", "disallow_roles"),
+    "disallow_users": (".permissions", "disallow_users"),
+    "global_permissions": (".permissions", "global_permissions"),
+    "guild_permissions": (".permissions", "guild_permissions"),
+}
+
+# Submodules, which are also imported on first access as attributes of the package.
+_SUBMODULES = frozenset(("choices", "client", "commands", "groups", "options", "permissions"))
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names and submodules on first access."""
+    if name in _DYNAMIC_IMPORTS:
+        module, attr = _DYNAMIC_IMPORTS[name]
+        value = getattr(importlib.import_module(module, __name__), attr)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the attributes of the package, including those not yet imported."""
+    return sorted(set(globals()) | set(__all__))
@@ -1,7 +1,8 @@
 """Interface for specifying option choices."""
 from __future__ import annotations
 
-from typing import Any, Generic, Optional, Type, TypeVar, Union
+from types import MappingProxyType
+from typing import Any, Generic, Mapping, Optional, Type, TypeVar, Union
 
 ChoiceType = Union[str, int, float]
 CT = TypeVar("CT")
@@ -10,6 +11,8 @@ CT = TypeVar("CT")
 class Choice(Generic[CT]):
     """A single choice as part of an option's choices."""
 
+    __slots__ = ("name", "value")
+
     def __init__(self, name: str, value: CT):
         """Store the choice attributes."""
         self.name = name
@@ -20,86 +23,45 @@ class Choice(Generic[CT]):
         return f"Choice(name={self.name!r}, value={self.value!r})"
 
 
-class ChoicesMeta(type, Generic[CT]):
-    """A metaclass for choices."""
-
-    @classmethod
-    def attribute_to_choice(
-        cls, name: str, value: Any
-    ) -> Optional[tuple[Choice[ChoiceType], Type[ChoiceType]]]:
-        """Convert an attribute to a choice."""
-        if isinstance(value, str):
-            # 'name' is the name of the Python attribute, which should be the
-            # internally-used *value* for the choice, and 'value' is the value
-            # of the Python attribute, which should be the user-displayed
-            # *name* of the choice.
-            return Choice(name=value, value=name), str
-        elif isinstance(value, Choice):
-            return value, type(value.value)
-        return None
-
-    @classmethod
-    def attributes_to_choices(
-        cls,
-        attrs: dict[str, Any],
-    ) -> tuple[dict[str, Choice[CT]], Type[CT]]:
-        """Get a mapping of attr name to chocie and the choice type for a choices class."""
-        choices = {}
-        choice_type = None
-        for name, value in attrs.items():
-            if name.startswith("_"):
-                continue
-            if not (choice_and_type := cls.attribute_to_choice(name, value)):
-                continue
-            choice, this_type = choice_and_type
-            if choice_type is None:
-                choice_type = this_type
-            elif choice_type != this_type:
-                raise TypeError(
-                    f"All choices must be of the same type, but {name} is "
-                    f"{this_type} and previous choices were {choice_type}."
-                )
-            choices[name] = choice
+def _attribute_to_choice(
+    name: str, value: Any
+) -> Optional[tuple[Choice[ChoiceType], Type[ChoiceType]]]:
+    """Convert an attribute to a choice."""
+    if isinstance(value, str):
+        # 'name' is the name of the Python attribute, which should be the
+        # internally-used *value* for the choice, and 'value' is the value
+        # of the Python attribute, which should be the user-displayed
+        # *name* of the choice.
+        return Choice(name=value, value=name), str
+    elif isinstance(value, Choice):
+        return value, type(value.value)
+    return None
+
+
+def _attributes_to_choices(attrs: dict[str, Any]) -> tuple[dict[str, Choice[CT]], Type[CT]]:
+    """Get a mapping of attr name to chocie and the choice type for a choices class."""
+    choices = {}
+    choice_type = None
+    for name, value in attrs.items():
+        if name.startswith("_"):
+            continue
+        if not (choice_and_type := _attribute_to_choice(name, value)):
+            continue
+        choice, this_type = choice_and_type
         if choice_type is None:
-            raise ValueError("There must be at least one choice.")
-        return choices, choice_type  # type: ignore
-
-    def __new__(
-        cls,
-        class_name: str,
-        parents: tuple[type],
-        attrs: dict[str, Any],
-        abstract: bool = False,
-    ) -> type:
-        """Create a new command group class."""
-        if abstract:
-            return super().__new__(cls, class_name, parents, attrs)
-        attrs_to_choices, choice_type = cls.attributes_to_choices(attrs)
-        for attr in attrs_to_choices:
-            del attrs[attr]
-        value_map = {}
-        name_map = {}
-        attrs["_value_map"] = value_map
-        attrs["_name_map"] = name_map
-        attrs["_choice_data"] = [
-            {"name": choice.name, "value": choice.value} for choice in attrs_to_choices.values()
-        ]
-        attrs["_choice_type"] = choice_type
-        new_cls = super().__new__(cls, class_name, parents, attrs)
-        for name, choice_data in attrs_to_choices.items():
-            choice = new_cls(choice_data.name, choice_data.value)
-            value_map[choice_data.value] = choice
-            name_map[name] = choice
-        return new_cls
-
-    def __getattr__(cls: Type[Choices[CT]], name: str) -> Choices[CT]:
-        """Get a choice by name."""
-        if name.startswith("__"):
-            return super().__getattr__(name)
-        return cls._name_map[name]  # type: ignore
-
-
-class Choices(Generic[CT], metaclass=ChoicesMeta, abstract=True):
+            choice_type = this_type
+        elif choice_type != this_type:
+            raise TypeError(
+                f"All choices must be of the same type, but {name} is "
+                f"{this_type} and previous choices were {choice_type}."
+            )
+        choices[name] = choice
+    if choice_type is None:
+        raise ValueError("There must be at least one choice.")
+    return choices, choice_type  # type: ignore
+
+
+class Choices(Generic[CT]):
     """A class containing each of the choices for some option.
 
     Example usage:
@@ -124,13 +86,16 @@ class Choices(Generic[CT], metaclass=ChoicesMeta, abstract=True):
     """
 
     # Discord choice value -> choice instance (class attribute)
-    _value_map: dict[CT, Choice[CT]]
+    _value_map: Mapping[CT, Choice[CT]]
 
     # Python choice name -> choice instance (class attribute)
-    _name_map: dict[str, Choice[CT]]
+    _name_map: Mapping[str, Choice[CT]]
+
+    # (name, value) pairs for each choice (class attribute)
+    _choice_data: tuple[tuple[str, CT], ...]
 
     # Discord JSON choice data (class attribute)
-    _choice_data: dict[str, dict[str, Union[str, CT]]]
+    _choice_data_json: list[dict[str, Union[str, CT]]]
 
     # Choice type (class attribute)
     _choice_type: Type[CT]
@@ -141,10 +106,34 @@ class Choices(Generic[CT], metaclass=ChoicesMeta, abstract=True):
     # Discord choice value (instance attribute)
     value: CT
 
+    def __init_subclass__(cls, abstract: bool = False, **kwargs: Any):
+        """Convert the attributes of a new choices class to choices."""
+        super().__init_subclass__(**kwargs)
+        if abstract:
+            return
+        attrs_to_choices, choice_type = _attributes_to_choices(dict(vars(cls)))
+        cls._choice_data = tuple(
+            (choice.name, choice.value) for choice in attrs_to_choices.values()
+        )
+        cls._choice_data_json = [{"name": name, "value": value} for name, value in cls._choice_data]
+        cls._choice_type = choice_type
+        value_map = {
+            choice.value: cls(choice.name, choice.value) for choice in attrs_to_choices.values()
+        }
+        name_map = {name: value_map[choice.value] for name, choice in attrs_to_choices.items()}
+        cls._value_map = MappingProxyType(value_map)
+        cls._name_map = MappingProxyType(name_map)
+        for name, choice in name_map.items():
+            # Replace the attribute so that it is a normal class attribute lookup.
+            setattr(cls, name, choice)
+
     @classmethod
     def _get_by_value(cls, value: CT) -> Choice[CT]:
         """Get a choice by value."""
-        return cls._value_map[value]
+        try:
+            return cls._value_map[value]
+        except KeyError:
+            raise ValueError(f"{value!r} is not a valid choice for {cls.__name__}.") from None
 
     def __init__(self, name: str, value: CT):
         """Store the attributes of a single choice."""
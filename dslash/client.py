@@ -1,9 +1,10 @@
 """Discord client type."""
+import asyncio
+import enum
 import logging
 import re
-import traceback
+import sys
 import typing
-from collections import defaultdict
 from typing import Any, Callable, Coroutine, Literal, Optional, Type, Union, overload
 
 import nextcord
@@ -26,8 +27,28 @@ logger = logging.getLogger("dslash")
 AsyncFunc = Callable[..., Coroutine]
 AsyncWrapper = Callable[[AsyncFunc], AsyncFunc]
 
-GUILD_ID_DEFAULT = "default"
-GuildID = Union[None, int, Literal["default"]]
+_APPLICATION_COMMAND = nextcord.InteractionType.application_command
+
+# The maximum number of command scopes to sync with Discord at once.
+_MAX_CONCURRENT_SYNCS = 5
+
+# Matches references to commands by index in API error messages, eg. "In 0.name"
+# or "In 0: ..." for errors on a whole command.
+_IN_INDEX_RE = re.compile(r"In\s(\d+)(?=[.:])")
+
+
+class _Default(enum.Enum):
+    """Sentinel for "use the client's default guild ID", compared by identity."""
+
+    DEFAULT = "default"
+
+    def __repr__(self) -> str:
+        """Return the name of the sentinel, so it reads well in signatures."""
+        return "GUILD_ID_DEFAULT"
+
+
+GUILD_ID_DEFAULT = _Default.DEFAULT
+GuildID = Union[None, int, Literal[_Default.DEFAULT]]
 
 
 class CommandClient(nextcord.Client):
@@ -65,16 +86,21 @@ class CommandClient(nextcord.Client):
         super().__init__(**options)
         self.guild_id = guild_id
         self.custom_interaction = custom_interaction
-        self._commands = defaultdict(dict)
+        self._commands = {}
         self._commands_by_id: dict[int, TopLevelCommand] = {}
         self._http: nextcord.http.HTTPClient = self._connection.http
-        self._event_handlers: dict[str, list[AsyncFunc]] = defaultdict(list)
+        self._event_handlers: dict[str, list[AsyncFunc]] = {}
 
     def dispatch(self, event_name: str, *args: Any, **kwargs: Any) -> None:
         """Dispatch an event and call additional handlers."""
         super().dispatch(event_name, *args, **kwargs)
-        for handler in self._event_handlers[event_name]:
-            self._schedule_event(handler, event_name, *args, **kwargs)
+        # Most events have no extra handlers, so avoid doing any more work for them.
+        handlers = self._event_handlers.get(event_name)
+        if not handlers:
+            return
+        schedule = self._schedule_event
+        for handler in handlers:
+            schedule(handler, event_name, *args, **kwargs)
 
     @overload
     def listener(self, value: AsyncFunc) -> AsyncFunc:
@@ -125,7 +151,9 @@ class CommandClient(nextcord.Client):
 
     def add_listener(self, event_name: str, handler: AsyncFunc):
         """Register a function as an event listener."""
-        self._event_handlers[event_name].append(handler)
+        # Interned so that lookups in dispatch can short-circuit on identity.
+        event_name = sys.intern(event_name)
+        self._event_handlers.setdefault(event_name, []).append(handler)
 
     async def on_interaction(self, interaction: nextcord.Interaction):
         """Handle a slash command interaction being sent.
@@ -134,15 +162,23 @@ class CommandClient(nextcord.Client):
         with `@client.event`, you must make sure to call this method, or
         slash commands will not work.
         """
-        if interaction.type == nextcord.InteractionType.application_command:
+        # Enum members are singletons, so an identity check is enough.
+        if interaction.type is not _APPLICATION_COMMAND:
+            return
+        if not self.is_ready():
             await self.wait_until_ready()
-            if (not interaction.data) or ("id" not in interaction.data):
-                return
+        try:
             command_id = int(interaction.data["id"])  # type: ignore
-            try:
-                await self._commands_by_id[command_id](interaction)
-            except SlashCommandInvokeError as exc:
-                self.dispatch("slash_command_error", interaction, exc)
+        except (KeyError, TypeError):
+            # There is no data, or no command ID in it.
+            return
+        command = self._commands_by_id.get(command_id)
+        if command is None:
+            return
+        try:
+            await command(interaction)
+        except SlashCommandInvokeError as exc:
+            self.dispatch("slash_command_error", interaction, exc)
 
     async def on_slash_command_error(
         self, interaction: nextcord.Interaction, error: SlashCommandInvokeError
@@ -154,10 +190,10 @@ class CommandClient(nextcord.Client):
         """
         # Log the error:
         original = error.original
-        message = "".join(
-            traceback.format_exception(type(original), original, original.__traceback__)
+        logger.error(
+            "An error occured while handling a command",
+            exc_info=(type(original), original, original.__traceback__),
         )
-        logger.error(f"An error occured while handling a command:\n{message}")
         # Send an error message:
         await interaction.response.send_message(
             embed=nextcord.Embed(title="Command error!", description=str(error), color=0xFF0000),
@@ -174,9 +210,27 @@ class CommandClient(nextcord.Client):
         if not self._connection.application_id:
             self._connection.application_id = int(data["id"])
         logger.info("Syncing commands...")
-        self._commands[None] = self._commands.get(None, {})
-        for scope, commands in self._commands.items():
-            await self._update_scope_commands(scope, commands)
+        # Always sync global commands, so stale ones are removed even if there are none.
+        self._commands.setdefault(None, {})
+        # Scopes are synced concurrently, but limited to avoid hitting rate limits.
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_SYNCS)
+
+        async def update_scope(scope: Optional[int], commands: dict[str, TopLevelCommand]):
+            async with semaphore:
+                await self._update_scope_commands(scope, commands)
+
+        tasks = [
+            asyncio.create_task(update_scope(scope, commands))
+            for scope, commands in self._commands.items()
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # Don't leave other scopes syncing in the background after a failed login.
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
         logger.info("Finished syncing commands.")
 
     async def _update_scope_commands(
@@ -190,18 +244,17 @@ class CommandClient(nextcord.Client):
             )
         except nextcord.HTTPException as error:
             self._handle_register_error(error, command_data)  # type: ignore
-        for command_data in created_commands:
-            command = commands[command_data["name"]]
-            command_id = int(command_data["id"])
-            self._commands_by_id[command_id] = command
+        commands_by_id = {int(data["id"]): commands[data["name"]] for data in created_commands}
+        for command_id, command in commands_by_id.items():
             command.id = command_id
+        self._commands_by_id.update(commands_by_id)
 
     async def _register_scope_commands(
         self, scope: typing.Optional[int], commands: list[EditApplicationCommand]
     ) -> list[ApplicationCommand]:
         """Register commands for a guild or globally."""
         if scope:
-            logger.debug(f"Registering commands for guild {scope}.")
+            logger.debug("Registering commands for guild %s.", scope)
             return await self._http.bulk_upsert_guild_commands(
                 self.application_id,
                 scope,
@@ -218,20 +271,16 @@ class CommandClient(nextcord.Client):
     ):
         """Replace references to commands by index to references by name."""
         if error.status == 400:
-            command_indices = set(re.findall(r"In\s(\d).", error.args[0]))
-            error_string = error.args[0]
-            for index in command_indices:
-                error_command = commands[int(index)]
-                error_string = error_string.replace(
-                    f"In {index}",
-                    "In {name}".format(**error_command),
-                )
+            error_string = _IN_INDEX_RE.sub(
+                lambda match: "In {name}".format(**commands[int(match[1])]),
+                error.args[0],
+            )
             error.args = (error_string, *error.args[1:])
         raise error
 
     def _store_command(self, command: TopLevelCommand):
         """Store a command to be registered on login."""
-        self._commands[command.guild_id][command.name] = command
+        self._commands.setdefault(command.guild_id, {})[command.name] = command
 
     def command(
         self,
@@ -309,7 +358,7 @@ class CommandClient(nextcord.Client):
             client=self,
             name=name,
             description=description,
-            guild_id=self.guild_id if guild_id == GUILD_ID_DEFAULT else guild_id,
+            guild_id=self.guild_id if guild_id is GUILD_ID_DEFAULT else guild_id,
         )
 
     def group(self, group: Union[SlashCommandGroup, Type["CommandGroup"]]) -> SlashCommandGroup:
@@ -348,7 +397,7 @@ class CommandClient(nextcord.Client):
         # think points to the type itself will in fact point to an instance of
         # SlashCommandGroup.
         group_: SlashCommandGroup = group  # type: ignore
-        if group_.guild_id == GUILD_ID_DEFAULT:
+        if group_.guild_id is GUILD_ID_DEFAULT:
             group_.guild_id = self.guild_id
         self._store_command(group_)
         return group_
@@ -1,7 +1,11 @@
 """Models to represent slash commands and sub-commands."""
 from __future__ import annotations
 
+import asyncio
+import functools
 import inspect
+import sys
+import types
 import typing
 from typing import Any, Optional, Type, Union
 
@@ -20,6 +24,47 @@ CommandCallback = Any
 Permissions = Optional[Union[list["PermissionsSetter"], "PermissionsSetter"]]
 
 
+def _is_plain_hint(annotation: Any) -> bool:
+    """Check if a type hint is a class or union of classes, which need no resolving."""
+    if typing.get_origin(annotation) in (typing.Union, types.UnionType):
+        return all(_is_plain_hint(arg) for arg in typing.get_args(annotation))
+    # Parametrised generics such as list[int] pass isinstance checks on older Pythons.
+    return isinstance(annotation, type) and not isinstance(annotation, types.GenericAlias)
+
+
+def _introspect(callback: CommandCallback) -> tuple[tuple[inspect.Parameter, Any], ...]:
+    """Get the parameters of a callback which are options, and their type hints.
+
+    This skips the first parameter (the interaction), and `self` if present.
+    """
+    parameters = tuple(inspect.signature(callback).parameters.values())
+    start = 2 if parameters and parameters[0].name == "self" else 1
+    parameters = parameters[start:]
+    if not all(_is_plain_hint(parameter.annotation) for parameter in parameters):
+        # get_type_hints will parse string type hints and forward references, and
+        # strip Annotated, which inspect won't.
+        annotations = typing.get_type_hints(callback)
+        return tuple((parameter, annotations[parameter.name]) for parameter in parameters)
+    hints = []
+    for parameter in parameters:
+        annotation = parameter.annotation
+        if parameter.default is None and sys.version_info < (3, 11):
+            # Before 3.11, get_type_hints made parameters defaulting to None optional.
+            annotation = Optional[annotation]
+        hints.append((parameter, annotation))
+    return tuple(hints)
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_docstring(doc: str) -> tuple[Optional[str], tuple[DocstringParam, ...]]:
+    """Get the short description and parameter descriptions from a docstring."""
+    if ":" not in doc and "\n" not in doc.strip():
+        # A single line with no parameters doesn't need the full parser.
+        return doc.strip() or None, ()
+    docstring = docstring_parser.parse(doc)
+    return docstring.short_description, tuple(docstring.params)
+
+
 class SlashCommandInvokeError(Exception):
     """An error raised when a slash command callback throws an error."""
 
@@ -34,19 +79,33 @@ class SlashCommandInvokeError(Exception):
 class BaseSlashCommand:
     """Base class for slash commands and slash sub-commands."""
 
+    __slots__ = ("name", "description", "_dumped")
+
     name: str
     description: str
 
     def __init__(self, *, name: str, description: str):
         """Set up a new slash command."""
-        self.name = name
+        # Names are interned as they are used as keys to look up data from Discord.
+        self.name = sys.intern(name) if name else name
         self.description = description
+        self._dumped: Optional[dict[str, Any]] = None
 
     def dump(self) -> dict[str, Any]:
-        """Get the data to create the command."""
-        data = {"name": self.name, "description": self.description}
-        self._add_dump_data(data)
-        return data
+        """Get the data to create the command.
+
+        This is cached, since commands do not change once they are defined.
+        Call `invalidate` after modifying a command that has been dumped.
+        """
+        if self._dumped is None:
+            data = {"name": self.name, "description": self.description}
+            self._add_dump_data(data)
+            self._dumped = data
+        return self._dumped
+
+    def invalidate(self):
+        """Clear the cached data of this command and any commands containing it."""
+        self._dumped = None
 
     def _add_dump_data(self, data: dict[str, Any]):
         """Add values to the data to create the command."""
@@ -62,11 +121,10 @@ class BaseSlashCommand:
             full_options = options
         else:
             full_options = interaction.data.get("options", []) if interaction.data else []
-        option_map = {option["name"]: option for option in full_options}
-        await self._process_option_data(interaction, option_map)  # type: ignore
+        await self._process_option_data(interaction, full_options)  # type: ignore
 
     async def _process_option_data(
-        self, interaction: nextcord.Interaction, options: dict[str, dict[str, Any]]
+        self, interaction: nextcord.Interaction, options: list[dict[str, Any]]
     ):
         """Process and use option data passed when the command is invoked."""
         raise NotImplementedError
@@ -75,42 +133,40 @@ class BaseSlashCommand:
 class CallableSlashCommand(BaseSlashCommand):
     """Base class for slash commands that do something (not just groups)."""
 
+    __slots__ = ("callback", "options", "_option_values", "_client", "prepend_params")
+
     def __init__(self, *, callback: CommandCallback, name: str, description: str):
         """Set up the slash command."""
         BaseSlashCommand.__init__(self, name=name, description=description)
         self.callback = callback
         self.options: dict[str, CommandOption] = {}
+        # The values of self.options, for iterating on each invocation.
+        self._option_values: tuple[CommandOption, ...] = ()
+        # Set when a top-level command is registered, otherwise looked up on
+        # first invocation.
+        self._client: Optional[CommandClient] = None
         # Params to pass to the callback before the interaction. Useful for
         # 'self' / 'cls' parameters.
         self.prepend_params: tuple[Any, ...] = ()
 
     def _process_callback(self):
         """Process the name, docstring and arguments of the callback."""
-        self.name = self.name or self.callback.__name__
-        docstring = docstring_parser.parse(self.callback.__doc__ or "")
+        self.name = sys.intern(self.name or self.callback.__name__)
+        short_description, params = _parse_docstring(self.callback.__doc__ or "")
         if not self.description:
-            self.description = docstring.short_description or "No description."
-        self._process_options(docstring.params)
+            self.description = short_description or "No description."
+        self._process_options(params)
 
-    def _process_options(self, descriptions: list[DocstringParam]):
+    def _process_options(self, descriptions: tuple[DocstringParam, ...]):
         """Get the options for this command from callback annotations."""
         description_map = {
             docstring_param.arg_name: docstring_param.description
             for docstring_param in descriptions
         }
-        signature = inspect.signature(self.callback)
-        # get_type_hints will parse string type hints, which inspect won't.
-        annotations = typing.get_type_hints(self.callback)
-        done_self = False
-        for n, parameter in enumerate(signature.parameters.values()):
-            if n == 0 and parameter.name == "self":
-                done_self = True
-                continue
-            if n == 0 or (done_self and n == 1):
-                # It's the first parameter, the interaction.
-                continue
+        for parameter, annotation in _introspect(self.callback):
             description = description_map.get(parameter.name)
-            self._process_option(parameter, annotations[parameter.name], description)
+            self._process_option(parameter, annotation, description)
+        self._option_values = tuple(self.options.values())
 
     def _process_option(
         self, parameter: inspect.Parameter, annotation: Type, description: Optional[str]
@@ -122,22 +178,41 @@ class CallableSlashCommand(BaseSlashCommand):
 
     def _add_dump_data(self, data: dict[str, Any]):
         """Add the command options to the dump data."""
-        data["options"] = data.get("options", [])
-        for option in self.options.values():
-            data["options"].append(option.dump())
+        if not self._option_values:
+            return
+        data["options"] = [option.dump() for option in self._option_values]
 
     async def _process_option_data(
-        self, interaction: nextcord.Interaction, options: dict[str, dict[str, Any]]
+        self, interaction: nextcord.Interaction, options: list[dict[str, Any]]
     ):
         """Process and use option data passed when the command is invoked."""
         arguments = {}
-        for arg, option in self.options.items():
-            data = options.get(option.name)
-            arguments[arg] = await option(data, interaction)
-        client: "CommandClient" = interaction._state._get_client()  # type: ignore
+        if self._option_values:
+            option_map = {option["name"]: option for option in options}
+            pending = {}
+            try:
+                for option in self._option_values:
+                    value = option(option_map.get(option.name), interaction)
+                    if inspect.isawaitable(value):
+                        pending[option.name] = value
+                    else:
+                        arguments[option.name] = value
+            except Exception:
+                # Don't leave API calls for earlier options un-awaited.
+                for value in pending.values():
+                    if inspect.iscoroutine(value):
+                        value.close()
+                raise
+            if pending:
+                # Resolving some options needs API calls, so do them concurrently.
+                arguments.update(zip(pending, await asyncio.gather(*pending.values())))
+        client = self._client
+        if client is None:
+            client = self._client = interaction._state._get_client()  # type: ignore
+        custom_interaction = client.custom_interaction
         try:
-            if client.custom_interaction:
-                interaction = client.custom_interaction(interaction)
+            if custom_interaction:
+                interaction = custom_interaction(interaction)
             await self.callback(*self.prepend_params, interaction, **arguments)
         except Exception as exc:
             raise SlashCommandInvokeError(exc) from exc
@@ -146,6 +221,8 @@ class CallableSlashCommand(BaseSlashCommand):
 class ContainerSlashCommand(BaseSlashCommand):
     """Base class for groups/commands which can have subcommands."""
 
+    __slots__ = ("subcommands",)
+
     def __init__(self, name: str, description: str):
         """Set up the command group."""
         super().__init__(name=name, description=description)
@@ -161,29 +238,44 @@ class ContainerSlashCommand(BaseSlashCommand):
             description=description,
         )
 
+    def _add_subcommand(self, subcommand: ChildSlashCommand):
+        """Add a subcommand to this container."""
+        subcommand.parent = self
+        self.subcommands[subcommand.name] = subcommand
+        self.invalidate()
+
     def _add_dump_data(self, data: dict[str, Any]):
         """Add the subcommands to the dump data."""
-        data["options"] = data.get("options", [])
-        for subcommand in self.subcommands.values():
-            data["options"].append(subcommand.dump())
+        if not self.subcommands:
+            return
+        data["options"] = [subcommand.dump() for subcommand in self.subcommands.values()]
 
     async def _process_option_data(
-        self, interaction: nextcord.Interaction, options: dict[str, dict[str, Any]]
+        self, interaction: nextcord.Interaction, options: list[dict[str, Any]]
     ):
-        """Process and use option data passed when the command is invoked.
-
-        Return value indicates whether the data was used.
-        """
-        for subcommand in self.subcommands.values():
-            if subcommand.name in options:
-                sub_options = options[subcommand.name].get("options", [])
-                await subcommand(interaction, sub_options)
+        """Process and use option data passed when the command is invoked."""
+        # Discord only ever sends the one subcommand that was invoked.
+        for option in options:
+            if subcommand := self.subcommands.get(option["name"]):
+                await subcommand(interaction, option.get("options", []))
                 return
 
 
 class ChildSlashCommand(BaseSlashCommand):
     """Base class for groups/commands which must have parents."""
 
+    # As with top level commands, the slot for this is declared by the child classes.
+    __slots__ = ()
+
+    # The container this is a subcommand of, set when it is added to one.
+    parent: Optional[ContainerSlashCommand]
+
+    def invalidate(self):
+        """Clear the cached data of this command and any commands containing it."""
+        super().invalidate()
+        if self.parent is not None:
+            self.parent.invalidate()
+
 
 class TopLevelCommand(BaseSlashCommand):
     """Base class for groups/commands at the top level of the hierarchy.
@@ -193,6 +285,10 @@ class TopLevelCommand(BaseSlashCommand):
     level command helps for implementation.
     """
 
+    # Multiple inheritance means only one base can define slots, so the
+    # attributes of top level commands are declared by the child classes.
+    __slots__ = ()
+
     def __init__(
         self,
         *,
@@ -214,6 +310,8 @@ class TopLevelCommand(BaseSlashCommand):
 class SlashCommandGroup(TopLevelCommand, ContainerSlashCommand):
     """A top-level slash command that contains other commands."""
 
+    __slots__ = ("guild_id", "id")
+
     def __init__(
         self,
         *,
@@ -230,14 +328,12 @@ class SlashCommandGroup(TopLevelCommand, ContainerSlashCommand):
         ContainerSlashCommand.__init__(self, name=name, description=description)
         TopLevelCommand.__init__(self, guild_id=guild_id)
 
-    def _add_dump_data(self, data: dict[str, Any]):
-        """Add the subcommands to the dump data."""
-        ContainerSlashCommand._add_dump_data(self, data)
-
 
 class SlashCommand(CallableSlashCommand, TopLevelCommand):
     """A callable top-level slash command."""
 
+    __slots__ = ("guild_id", "id")
+
     def __init__(
         self,
         *,
@@ -256,32 +352,33 @@ class SlashCommand(CallableSlashCommand, TopLevelCommand):
         self._process_callback()
         TopLevelCommand.__init__(self, guild_id=guild_id)
 
-    def _add_dump_data(self, data: dict[str, Any]):
-        """Add the command options to the dump data."""
-        CallableSlashCommand._add_dump_data(self, data)
-
 
 class SlashCommandSubGroup(ChildSlashCommand, ContainerSlashCommand):
     """A sub-group of slash commands."""
 
+    __slots__ = ("parent",)
+
     def __init__(self, name: str, description: str):
         """Set up the slash command group."""
         ContainerSlashCommand.__init__(self, name=name, description=description)
+        self.parent = None
 
     def _add_dump_data(self, data: dict[str, Any]):
         """Add the option type to the dump data."""
         ContainerSlashCommand._add_dump_data(self, data)
-        ChildSlashCommand._add_dump_data(self, data)
         data["type"] = ApplicationCommandOptionType.sub_command_group.value
 
 
 class SlashSubCommand(ChildSlashCommand, CallableSlashCommand):
     """A subcommand of a slash command."""
 
+    __slots__ = ("parent",)
+
     def __init__(self, callback: CommandCallback, name: str, description: str):
         """Set up a new subcommand."""
         CallableSlashCommand.__init__(self, callback=callback, name=name, description=description)
         self._process_callback()
+        self.parent = None
 
     def _add_dump_data(self, data: dict[str, Any]):
         """Add the option type to the dump data."""
@@ -338,6 +435,7 @@ class SlashCommandConstructor(BaseSlashCommandConstructor[SlashCommand]):
     def register(self, command: SlashCommand):
         """Register the created command."""
         if self.client:
+            command._client = self.client
             self.client._store_command(command)
 
 
@@ -360,4 +458,4 @@ class SlashSubCommandConstructor(BaseSlashCommandConstructor[SlashSubCommand]):
     def register(self, command: SlashSubCommand):
         """Register the created subcommand."""
         if self.parent:
-            self.parent.subcommands[command.name] = command
+            self.parent._add_subcommand(command)
@@ -14,10 +14,13 @@ from .commands import (
 )
 from .permissions import warn_permissions_deprecation
 
+# Matches the boundaries between words in a class name.
+_GROUP_NAME_RE = re.compile(r"([a-z])([A-Z0-9])")
+
 
 def class_name_to_group_name(class_name: str) -> str:
     """Convert a class name to a group name."""
-    return re.sub(r"([a-z])([A-Z0-9])", r"\1_\2", class_name).lower()
+    return _GROUP_NAME_RE.sub(r"\1_\2", class_name).lower()
 
 
 GT = TypeVar("GT", SlashCommandGroup, SlashCommandSubGroup)
@@ -52,11 +55,11 @@ class BaseCommandGroupMeta(type, Generic[GT]):
         # Command groups are singletons.
         instance = new_class()
         for attr in attrs.values():
+            if not isinstance(attr, ChildSlashCommand):
+                continue
             if isinstance(attr, SlashSubCommand):
                 attr.prepend_params = (instance,)
-            elif not isinstance(attr, ChildSlashCommand):
-                continue
-            group.subcommands[attr.name] = attr
+            group._add_subcommand(attr)
         return group
 
 
@@ -1,7 +1,8 @@
 """Models to represent arguments to slash commands."""
+import sys
 import types
 import typing
-from typing import Any, Optional, Type, Union
+from typing import Any, Callable, Optional, Type, Union
 
 import nextcord
 from nextcord.enums import Enum
@@ -10,6 +11,9 @@ from .choices import Choices
 
 Channel = nextcord.abc.GuildChannel
 Mentionable = Union[nextcord.User, nextcord.Member, nextcord.Role]
+_MENTIONABLE_ARGS = frozenset(typing.get_args(Mentionable))
+_NONE_TYPE = type(None)
+OptionResolver = Callable[[Any, nextcord.Interaction], Any]
 
 
 class ApplicationCommandOptionType(Enum):
@@ -28,50 +32,84 @@ class ApplicationCommandOptionType(Enum):
     attachment = 11
 
 
+# Option types which can be looked up directly, before checking subclasses.
+_OPTION_TYPES = {
+    str: ApplicationCommandOptionType.string,
+    bool: ApplicationCommandOptionType.boolean,
+    int: ApplicationCommandOptionType.integer,
+    float: ApplicationCommandOptionType.number,
+    nextcord.User: ApplicationCommandOptionType.user,
+    nextcord.Member: ApplicationCommandOptionType.user,
+    nextcord.abc.User: ApplicationCommandOptionType.user,
+    nextcord.TextChannel: ApplicationCommandOptionType.channel,
+    nextcord.VoiceChannel: ApplicationCommandOptionType.channel,
+    nextcord.CategoryChannel: ApplicationCommandOptionType.channel,
+    nextcord.abc.GuildChannel: ApplicationCommandOptionType.channel,
+    nextcord.Role: ApplicationCommandOptionType.role,
+    nextcord.Attachment: ApplicationCommandOptionType.attachment,
+}
+
+
 class CommandOption:
     """An argument to a slash command."""
 
+    __slots__ = (
+        "description",
+        "name",
+        "type",
+        "choices",
+        "required",
+        "_type_value",
+        "_resolver",
+        "_dumped",
+    )
+
     def __init__(self, *, name: str, description: str, type: Type):
         """Set up the command option."""
         self.description = description
-        self.name = name
+        self.name = sys.intern(name)
         self.type, self.choices, self.required = self._get_type_metadata(type)
+        # The type can't change, so work out how to handle it up front.
+        self._type_value = self._get_type_value()
+        self._resolver = _RESOLVERS[self._type_value]
+        self._dumped = {
+            "name": self.name,
+            "description": self.description,
+            "required": self.required,
+            "type": self._type_value.value,
+            "choices": self.choices._choice_data_json if self.choices else None,
+        }
 
     def _get_optional_type(self, param_type: Type) -> Optional[Type]:
         """Return the root type if 'type' is optional."""
         if typing.get_origin(param_type) in (typing.Union, types.UnionType):
             args = typing.get_args(param_type)
-            if len(args) == 2 and isinstance(None, args[1]):
-                return args[0]
+            root_args = tuple(arg for arg in args if arg is not _NONE_TYPE)
+            if len(root_args) == len(args):
+                return None
+            if len(root_args) == 1:
+                return root_args[0]
+            # Eg. Optional[Mentionable], which is checked when getting the type value.
+            return Union[root_args]  # type: ignore
         return None
 
-    def _get_type_metadata(self, type: Type) -> tuple[Type, Optional[Type[Choices]], bool]:
+    def _get_type_metadata(self, param_type: Type) -> tuple[Type, Optional[Type[Choices]], bool]:
         """Get the root type, associated choices, and whether it is required."""
-        if root_type := self._get_optional_type(type):
-            type = root_type
+        if root_type := self._get_optional_type(param_type):
+            param_type = root_type
             required = False
         else:
             required = True
-        if issubclass(type, Choices):
-            choices = type
-            type = choices._choice_type
+        if isinstance(param_type, type) and issubclass(param_type, Choices):
+            choices = param_type
+            param_type = choices._choice_type
         else:
             choices = None
-        return type, choices, required
+        return param_type, choices, required
 
     def dump(self) -> dict[str, Any]:
         """Get the JSON data for registering this option with the API."""
-        if self.choices:
-            choice_dump = self.choices._choice_data
-        else:
-            choice_dump = None
-        return {
-            "name": self.name,
-            "description": self.description,
-            "required": self.required,
-            "type": self.type_value.value,
-            "choices": choice_dump,
-        }
+        return self._dumped
 
     @property
     def _is_user_type(self) -> bool:
@@ -95,10 +133,25 @@ class CommandOption:
     @property
     def type_value(self) -> ApplicationCommandOptionType:
         """Get the Discord API code for the option's type."""
-        if (not self.type) or issubclass(self.type, str):
+        return self._type_value
+
+    def _get_type_value(self) -> ApplicationCommandOptionType:
+        """Work out the Discord API code for the option's type."""
+        # Exact types (including bool, which can't be subclassed) are looked up
+        # directly, so the checks below only need to handle subclasses.
+        if type_value := _OPTION_TYPES.get(self.type):
+            return type_value
+        if not self.type:
+            return ApplicationCommandOptionType.string
+        if not isinstance(self.type, type):
+            # Unions aren't classes, so must be checked before using issubclass.
+            if typing.get_origin(self.type) in (typing.Union, types.UnionType):
+                if frozenset(typing.get_args(self.type)) == _MENTIONABLE_ARGS:
+                    return ApplicationCommandOptionType.mentionable
+                raise TypeError("Union type not allowed for option type (except Mentionable).")
+            raise TypeError(f"Unsupported option type {self.type!r}.")
+        if issubclass(self.type, str):
             return ApplicationCommandOptionType.string
-        if issubclass(self.type, bool):
-            return ApplicationCommandOptionType.boolean
         if issubclass(self.type, int):
             return ApplicationCommandOptionType.integer
         if issubclass(self.type, float):
@@ -111,54 +164,84 @@ class CommandOption:
             return ApplicationCommandOptionType.role
         if issubclass(self.type, nextcord.Attachment):
             return ApplicationCommandOptionType.attachment
-        if typing.get_origin(self.type) is typing.Union:  # type: ignore
-            if typing.get_args(self.type) == typing.get_args(Mentionable):
-                return ApplicationCommandOptionType.mentionable
-            raise TypeError("Union type not allowed for option type (except Mentionable).")
         raise TypeError(f"Unsupported option type {self.type!r}.")
 
-    async def __call__(
-        self, data: Optional[dict[str, Any]], interaction: nextcord.Interaction
-    ) -> Any:
-        """Process option data from the API."""
+    def __call__(self, data: Optional[dict[str, Any]], interaction: nextcord.Interaction) -> Any:
+        """Process option data from the API.
+
+        Most values can be resolved straight away and are returned directly.
+        If resolving the value needs an API call, an awaitable is returned
+        instead.
+        """
         if (not data) or "value" not in data:
             return None
-        value = data["value"]
-        type = ApplicationCommandOptionType(data["type"])
-        if type in (
-            ApplicationCommandOptionType.string,
-            ApplicationCommandOptionType.boolean,
-            ApplicationCommandOptionType.integer,
-            ApplicationCommandOptionType.number,
-        ):
-            if self.choices:
-                return self.choices._get_by_value(value)
-            return value
-        if type == ApplicationCommandOptionType.attachment:
-            data = (
-                interaction.data.get("resolved", {}).get("attachments", {}).get(value)
-                if interaction.data
-                else None
-            )
-            if data:
-                return nextcord.Attachment(data=data, state=interaction._state)
-            raise ValueError("Attachment option recieved without resolved attachment.")
-        # We could use `resolved` for users/roles/channels, but working with
-        # discord.py/nextcord internals is more hassle than it's worth.
-        value = int(value)
-        if not (guild := interaction.guild):
-            raise ValueError("User/role/channel option recieved without a guild.")
-        if type == ApplicationCommandOptionType.mentionable:
-            if role := guild.get_role(value):
-                return role
-        if type in (
-            ApplicationCommandOptionType.user,
-            ApplicationCommandOptionType.mentionable,
-        ):
-            if not (user := guild.get_member(value)):
-                user = await guild.fetch_member(value)
-            return user
-        if type == ApplicationCommandOptionType.role:
-            return guild.get_role(value)
-        if type == ApplicationCommandOptionType.channel:
-            return guild.get_channel(value)
+        if self.choices:
+            return self.choices._get_by_value(data["value"])
+        return self._resolver(data["value"], interaction)
+
+
+def _resolve_value(value: Any, interaction: nextcord.Interaction) -> Any:
+    """Resolve a string, boolean, integer or number option."""
+    return value
+
+
+def _resolve_attachment(value: Any, interaction: nextcord.Interaction) -> Any:
+    """Resolve an attachment option."""
+    data = (
+        interaction.data.get("resolved", {}).get("attachments", {}).get(value)
+        if interaction.data
+        else None
+    )
+    if data:
+        return nextcord.Attachment(data=data, state=interaction._state)
+    raise ValueError("Attachment option recieved without resolved attachment.")
+
+
+# We could use `resolved` for users/roles/channels, but working with
+# discord.py/nextcord internals is more hassle than it's worth.
+
+
+def _get_guild(interaction: nextcord.Interaction) -> nextcord.Guild:
+    """Get the guild needed to resolve a user/role/channel option."""
+    if not (guild := interaction.guild):
+        raise ValueError("User/role/channel option recieved without a guild.")
+    return guild
+
+
+def _resolve_user(value: Any, interaction: nextcord.Interaction) -> Any:
+    """Resolve a user option, returning an awaitable if they must be fetched."""
+    guild = _get_guild(interaction)
+    value = int(value)
+    if user := guild.get_member(value):
+        return user
+    return guild.fetch_member(value)
+
+
+def _resolve_mentionable(value: Any, interaction: nextcord.Interaction) -> Any:
+    """Resolve a mentionable option, which may be a role or a user."""
+    if role := _get_guild(interaction).get_role(int(value)):
+        return role
+    return _resolve_user(value, interaction)
+
+
+def _resolve_role(value: Any, interaction: nextcord.Interaction) -> Any:
+    """Resolve a role option."""
+    return _get_guild(interaction).get_role(int(value))
+
+
+def _resolve_channel(value: Any, interaction: nextcord.Interaction) -> Any:
+    """Resolve a channel option."""
+    return _get_guild(interaction).get_channel(int(value))
+
+
+_RESOLVERS: dict[ApplicationCommandOptionType, OptionResolver] = {
+    ApplicationCommandOptionType.string: _resolve_value,
+    ApplicationCommandOptionType.boolean: _resolve_value,
+    ApplicationCommandOptionType.integer: _resolve_value,
+    ApplicationCommandOptionType.number: _resolve_value,
+    ApplicationCommandOptionType.attachment: _resolve_attachment,
+    ApplicationCommandOptionType.user: _resolve_user,
+    ApplicationCommandOptionType.mentionable: _resolve_mentionable,
+    ApplicationCommandOptionType.role: _resolve_role,
+    ApplicationCommandOptionType.channel: _resolve_channel,
+}